@@ -0,0 +1,82 @@
+"""
+Ahead-of-time build of the fixed-income batch kernels.
+
+Running ``python -m investalchemy._aot_build`` (or ``make native``) compiles the
+``_fi_native`` extension module next to this file. When it is present, the
+``*_batch`` methods of ``FixedIncomeEvaluator`` call it directly instead of
+importing Numba and loading the JIT-compiled ufuncs, which removes that start-up
+cost from short-lived processes. The extension does not need Numba at runtime.
+
+Each export takes equally sized 1-D float64 arrays; broadcasting is done by the
+caller before the call.
+"""
+
+from pathlib import Path
+
+import numpy as np
+from numba.pycc import CC
+
+from investalchemy import _fi_kernels
+
+cc = CC("_fi_native")
+cc.output_dir = str(Path(__file__).parent)
+
+
+@cc.export("effective_annual_rate_batch", "f8[:](f8[:], f8[:])")
+def effective_annual_rate_batch(r, n):
+    out = np.empty(r.size)
+    for i in range(r.size):
+        out[i] = _fi_kernels.effective_annual_rate(r[i], n[i])
+    return out
+
+
+@cc.export("annuity_discount_factor_batch", "f8[:](f8[:], f8[:])")
+def annuity_discount_factor_batch(r, n):
+    out = np.empty(r.size)
+    for i in range(r.size):
+        out[i] = _fi_kernels.annuity_discount_factor(r[i], n[i])
+    return out
+
+
+@cc.export("bond_price_batch", "f8[:](f8[:], f8[:], f8[:], f8[:])")
+def bond_price_batch(coupon, principal, r, n):
+    out = np.empty(r.size)
+    for i in range(r.size):
+        out[i] = _fi_kernels.bond_price(coupon[i], principal[i], r[i], n[i])
+    return out
+
+
+@cc.export("perpetuity_price_batch", "f8[:](f8[:], f8[:], f8[:])")
+def perpetuity_price_batch(cash_flow, r, g):
+    out = np.empty(r.size)
+    for i in range(r.size):
+        out[i] = _fi_kernels.perpetuity_price(cash_flow[i], r[i], g[i])
+    return out
+
+
+@cc.export("treasury_bill_price_batch", "f8[:](f8[:], f8[:], f8[:])")
+def treasury_bill_price_batch(principal, d, D):
+    out = np.empty(d.size)
+    for i in range(d.size):
+        out[i] = _fi_kernels.treasury_bill_price(principal[i], d[i], D[i])
+    return out
+
+
+@cc.export("yield_for_treasury_bill_batch", "f8[:](f8[:], f8[:])")
+def yield_for_treasury_bill_batch(principal, price):
+    out = np.empty(price.size)
+    for i in range(price.size):
+        out[i] = _fi_kernels.yield_for_treasury_bill(principal[i], price[i])
+    return out
+
+
+@cc.export("apr_for_treasury_bills_batch", "f8[:](f8[:], f8[:])")
+def apr_for_treasury_bills_batch(r, D):
+    out = np.empty(r.size)
+    for i in range(r.size):
+        out[i] = _fi_kernels.apr_for_treasury_bills(r[i], D[i])
+    return out
+
+
+if __name__ == "__main__":
+    cc.compile()
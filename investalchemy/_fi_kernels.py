@@ -0,0 +1,80 @@
+"""
+Numba-compiled kernels backing the batch methods of ``FixedIncomeEvaluator``.
+
+The scalar kernels are ``njit`` functions that can be called from other compiled
+code; the ``*_batch`` ufuncs broadcast them over NumPy arrays in a single native
+loop. Compiled machine code is cached on disk so the JIT cost is only paid once.
+"""
+
+from numba import float64, njit, vectorize
+
+
+@njit(cache=True, fastmath=True)
+def effective_annual_rate(r, n):
+    return (1.0 + r) ** n - 1.0
+
+
+@njit(cache=True, fastmath=True)
+def annuity_discount_factor(r, n):
+    return (1.0 - 1.0 / (1.0 + r) ** n) / r
+
+
+@njit(cache=True, fastmath=True)
+def bond_price(coupon, principal, r, n):
+    discount = 1.0 / (1.0 + r) ** n
+    return coupon * (1.0 - discount) / r + principal * discount
+
+
+@njit(cache=True, fastmath=True)
+def perpetuity_price(cash_flow, r, g):
+    return cash_flow / (r - g)
+
+
+@njit(cache=True, fastmath=True)
+def treasury_bill_price(principal, d, D):
+    return principal * (1.0 - d * (D / 360.0))
+
+
+@njit(cache=True, fastmath=True)
+def yield_for_treasury_bill(principal, price):
+    return principal / price - 1.0
+
+
+@njit(cache=True, fastmath=True)
+def apr_for_treasury_bills(r, D):
+    return r * 365.0 / D
+
+
+@vectorize([float64(float64, float64)], cache=True)
+def effective_annual_rate_batch(r, n):
+    return effective_annual_rate(r, n)
+
+
+@vectorize([float64(float64, float64)], cache=True)
+def annuity_discount_factor_batch(r, n):
+    return annuity_discount_factor(r, n)
+
+
+@vectorize([float64(float64, float64, float64, float64)], cache=True)
+def bond_price_batch(coupon, principal, r, n):
+    return bond_price(coupon, principal, r, n)
+
+
+@vectorize([float64(float64, float64, float64)], cache=True)
+def perpetuity_price_batch(cash_flow, r, g):
+    return perpetuity_price(cash_flow, r, g)
+
+
+@vectorize([float64(float64, float64, float64)], cache=True)
+def treasury_bill_price_batch(principal, d, D):
+    return treasury_bill_price(principal, d, D)
+
+
+@vectorize([float64(float64, float64)], cache=True)
+def yield_for_treasury_bill_batch(principal, price):
+    return yield_for_treasury_bill(principal, price)
+
+
+@vectorize([float64(float64, float64)], cache=True)
+def apr_for_treasury_bills_batch(r, D):
+    return apr_for_treasury_bills(r, D)
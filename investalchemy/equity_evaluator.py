@@ -1,3 +1,12 @@
+import numpy as np
+
+from investalchemy.fi_evaluator import FixedIncomeEvaluator
+
+# Up to this many cash flows a Horner loop beats NumPy's per-call overhead; longer
+# series are discounted in a single vectorized pass.
+_HORNER_MAX_CASH_FLOWS = 32
+
+
 class EquityEvaluator:
     """
     A utility class for evaluating equity investments and performing related financial
@@ -58,10 +67,9 @@ class EquityEvaluator:
                 # R5 dividend, 5% rate, 10 years
                 38.61  # Present value of ~R38.61
         """
-        price = 0
-        for i in range(1, t + 1):
-            price += dividend_payment / (1 + r) ** i
-        return price
+        if r == 0:
+            return dividend_payment * t
+        return dividend_payment * FixedIncomeEvaluator.annuity_discount_factor(r, t)
 
     @staticmethod
     def gordon_growth_model(dividend_payment: float, r: float, g: float) -> float:
@@ -161,9 +169,17 @@ class EquityEvaluator:
         Example:
             >>> EquityEvaluator.net_present_value([-100, 50, 60, 70], 0.05)
                 # Initial investment R100, cash flows R50, R60, R70
-                64.47  # NPV of ~R64.47
+                62.51  # NPV of ~R62.51
         """
-        npv = 0
-        for t, cash_flow in enumerate(cash_flows):
-            npv += cash_flow / (1 + r) ** t
-        return npv
+        if len(cash_flows) <= _HORNER_MAX_CASH_FLOWS:
+            # Horner's rule in x = 1 / (1 + r): one division, then a multiply-add
+            # per cash flow instead of a power per cash flow
+            x = 1.0 / (1.0 + r)
+            npv = 0.0
+            for cash_flow in reversed(cash_flows):
+                npv = npv * x + cash_flow
+            return float(npv)
+
+        cash_flows = np.asarray(cash_flows, dtype=np.float64)
+        discount_factors = (1.0 + r) ** -np.arange(cash_flows.size)
+        return float(cash_flows @ discount_factors)
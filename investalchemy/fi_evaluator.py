@@ -1,3 +1,11 @@
+import numpy as np
+
+try:
+    from investalchemy import _fi_native
+except ImportError:  # not built; see investalchemy/_aot_build.py
+    _fi_native = None
+
+
 class FixedIncomeEvaluator:
     """
     A utility class for evaluating fixed-income securities and performing related
@@ -12,6 +20,9 @@ class FixedIncomeEvaluator:
     - Annual percentage rate (APR) for Treasury bills
 
     All methods assume periodic rates and cash flows, unless otherwise specified.
+    The ``*_batch`` methods accept broadcastable arrays and evaluate the formula in
+    a single compiled loop, using the ahead-of-time built extension when available
+    and Numba's JIT otherwise.
     """
 
     @staticmethod
@@ -34,6 +45,21 @@ class FixedIncomeEvaluator:
         """
         return (1 + r) ** n - 1
 
+    @staticmethod
+    def effective_annual_rate_batch(r: np.ndarray, n: np.ndarray) -> np.ndarray:
+        """
+        Calculates the effective annual rate for arrays of periodic rates and
+        compounding periods.
+
+        Args:
+            r: The periodic interest rates.
+            n: The number of compounding periods in a year.
+
+        Returns:
+            np.ndarray: The effective annual rates, broadcast over the inputs.
+        """
+        return _batch("effective_annual_rate_batch", r, n)
+
     @staticmethod
     def annuity_compound_factor(r: float, n: int) -> float:
         """
@@ -53,6 +79,7 @@ class FixedIncomeEvaluator:
         """
         return ((1 + r) ** n - 1) / r
 
+    @staticmethod
     def annuity_discount_factor(r: float, n: int) -> float:
         """
         Calculates the present value of an ordinary annuity per unit payment.
@@ -71,7 +98,22 @@ class FixedIncomeEvaluator:
         """
         return (1 - (1 / (1 + r) ** n)) / r
 
-    def bond_price(self, coupon: float, principal: float, r: float, n: int) -> float:
+    @staticmethod
+    def annuity_discount_factor_batch(r: np.ndarray, n: np.ndarray) -> np.ndarray:
+        """
+        Calculates the annuity discount factor for arrays of rates and periods.
+
+        Args:
+            r: The periodic discount rates.
+            n: The number of periods.
+
+        Returns:
+            np.ndarray: The annuity discount factors, broadcast over the inputs.
+        """
+        return _batch("annuity_discount_factor_batch", r, n)
+
+    @staticmethod
+    def bond_price(coupon: float, principal: float, r: float, n: int) -> float:
         """
         Calculates the price of a bond given its coupon, principal, discount rate,
         and number of periods.
@@ -91,12 +133,63 @@ class FixedIncomeEvaluator:
                 # R50 coupon, R1000 principal, 5% rate, 10 periods
                 1000.0  # Bond priced at par
         """
-        discount_coupons = coupon * self.annuity_discount_factor(r, n)
-        discount_principal = principal / (1 + r) ** n
-        bond_price = discount_coupons + discount_principal
-        return bond_price
+        discount = 1.0 / (1.0 + r) ** n
+        discount_coupons = coupon * (1.0 - discount) / r
+        discount_principal = principal * discount
+        return discount_coupons + discount_principal
+
+    @staticmethod
+    def bond_price_batch(
+        coupon: np.ndarray, principal: np.ndarray, r: np.ndarray, n: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculates bond prices for arrays of coupons, principals, rates and periods.
+
+        Args:
+            coupon: The periodic coupon payments.
+            principal: The principals (face values) of the bonds.
+            r: The periodic discount rates.
+            n: The number of periods until maturity.
+
+        Returns:
+            np.ndarray: The bond prices, broadcast over the inputs.
+
+        Example:
+            >>> FixedIncomeEvaluator.bond_price_batch(50, 1000, [0.04, 0.05], 10)
+            array([1081.11, 1000.0])
+        """
+        return _batch("bond_price_batch", coupon, principal, r, n)
+
+    @staticmethod
+    def bond_price_grid(
+        coupon: float, principal: float, r: np.ndarray, n: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculates a rate/maturity sensitivity grid of bond prices.
 
-    def annuity_price(self, payment: float, r: float, n: int) -> float:
+        Args:
+            coupon: The periodic coupon payment.
+            principal: The principal (face value) of the bond.
+            r: The periodic discount rates to sweep.
+            n: The numbers of periods until maturity to sweep.
+
+        Returns:
+            np.ndarray: The bond prices, with one row per rate and one column per
+                        maturity.
+
+        Example:
+            >>> FixedIncomeEvaluator.bond_price_grid(50, 1000, [0.04, 0.05], [5, 10])
+            array([[1044.52, 1081.11],
+                   [1000.0, 1000.0]])
+        """
+        r = np.asarray(r, dtype=np.float64)
+        n = np.asarray(n, dtype=np.float64)
+        return FixedIncomeEvaluator.bond_price_batch(
+            coupon, principal, r[:, np.newaxis], n[np.newaxis, :]
+        )
+
+    @staticmethod
+    def annuity_price(payment: float, r: float, n: int) -> float:
         """
         Calculates the present value of an ordinary annuity.
 
@@ -113,7 +206,7 @@ class FixedIncomeEvaluator:
             >>> evaluator.annuity_price(100, 0.05, 10) # R100 payment,5% rate,10 periods
             772.17  # Present value of ~R772.17
         """
-        return payment * self.annuity_discount_factor(r, n)
+        return payment * FixedIncomeEvaluator.annuity_discount_factor(r, n)
 
     @staticmethod
     def perpetuity_price(cash_flow: float, r: float, g: float = 0) -> float:
@@ -135,6 +228,23 @@ class FixedIncomeEvaluator:
         """
         return cash_flow / (r - g)
 
+    @staticmethod
+    def perpetuity_price_batch(
+        cash_flow: np.ndarray, r: np.ndarray, g: np.ndarray = 0
+    ) -> np.ndarray:
+        """
+        Calculates perpetuity prices for arrays of cash flows, rates and growth rates.
+
+        Args:
+            cash_flow: The periodic cash flows.
+            r: The discount rates.
+            g: The growth rates of the cash flows (default is 0).
+
+        Returns:
+            np.ndarray: The perpetuity prices, broadcast over the inputs.
+        """
+        return _batch("perpetuity_price_batch", cash_flow, r, g)
+
     @staticmethod
     def treasury_bill_price(principal: float, d: float, D: int) -> float:
         """
@@ -156,6 +266,24 @@ class FixedIncomeEvaluator:
         """
         return principal * (1 - (d * (D / 360)))
 
+    @staticmethod
+    def treasury_bill_price_batch(
+        principal: np.ndarray, d: np.ndarray, D: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculates Treasury bill prices for arrays of principals, discount yields and
+        days to maturity.
+
+        Args:
+            principal: The face values of the Treasury bills.
+            d: The discount yields.
+            D: The number of days until maturity.
+
+        Returns:
+            np.ndarray: The Treasury bill prices, broadcast over the inputs.
+        """
+        return _batch("treasury_bill_price_batch", principal, d, D)
+
     @staticmethod
     def yield_for_treasury_bill(principal: float, price: float) -> float:
         """
@@ -175,6 +303,22 @@ class FixedIncomeEvaluator:
         """
         return (principal / price) - 1
 
+    @staticmethod
+    def yield_for_treasury_bill_batch(
+        principal: np.ndarray, price: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculates Treasury bill yields for arrays of principals and prices.
+
+        Args:
+            principal: The face values of the Treasury bills.
+            price: The prices of the Treasury bills.
+
+        Returns:
+            np.ndarray: The yields, broadcast over the inputs.
+        """
+        return _batch("yield_for_treasury_bill_batch", principal, price)
+
     @staticmethod
     def apr_for_treasury_bills(r: float, D: int) -> float:
         """
@@ -194,3 +338,34 @@ class FixedIncomeEvaluator:
             0.02028  # APR of ~2.028%
         """
         return r * 365 / D
+
+    @staticmethod
+    def apr_for_treasury_bills_batch(r: np.ndarray, D: np.ndarray) -> np.ndarray:
+        """
+        Calculates Treasury bill APRs for arrays of yields and days to maturity.
+
+        Args:
+            r: The yields of the Treasury bills.
+            D: The number of days until maturity.
+
+        Returns:
+            np.ndarray: The APRs, broadcast over the inputs.
+        """
+        return _batch("apr_for_treasury_bills_batch", r, D)
+
+
+def _batch(kernel: str, *args: np.ndarray) -> np.ndarray:
+    """
+    Evaluates a batch kernel over broadcastable inputs, preferring the ahead-of-time
+    compiled ``_fi_native`` module and falling back to the Numba ufuncs, which are
+    imported on first use to keep importing this module cheap.
+    """
+    if _fi_native is None:
+        from investalchemy import _fi_kernels
+
+        return getattr(_fi_kernels, kernel)(*args)
+
+    arrays = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in args))
+    shape = arrays[0].shape
+    result = getattr(_fi_native, kernel)(*(a.ravel() for a in arrays))
+    return result.reshape(shape) if shape else result[0]
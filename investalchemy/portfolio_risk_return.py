@@ -1,3 +1,5 @@
+from math import sqrt
+
 import numpy as np
 
 
@@ -8,7 +10,7 @@ class PortfolioLevelEvaluator:
     - Return on a portfolios
     - Covariance between two assets
     - Correlation between two assets
-    - Volatility (standard deviation)
+    - Volatility (standard deviation), for one or many portfolios
     """
 
     @staticmethod
@@ -25,41 +27,171 @@ class PortfolioLevelEvaluator:
         return np.dot(weights, returns)
 
     @staticmethod
-    def calculate_covariance_matrix(return_of_assets: list[list[float]]) -> np.ndarray:
+    def calculate_covariance_matrix(
+        return_of_assets: list[list[float]] | np.ndarray,
+    ) -> np.ndarray:
         """
         Calculates the covariance matrix of asset returns.
         Args:
-            return_of_assets: The returns of the assets in the portfolio.
+            return_of_assets: The returns of the assets in the portfolio, one row per
+                asset.
         Returns:
             np.ndarray: The covariance matrix.
         """
-        return np.cov(np.array(return_of_assets))
+        return PortfolioLevelEvaluator._covariance_matrix(return_of_assets)
 
     @staticmethod
-    def calculate_correlation_matrix(return_of_assets: list[list[float]]) -> np.ndarray:
+    def calculate_correlation_matrix(
+        return_of_assets: list[list[float]] | np.ndarray,
+    ) -> np.ndarray:
         """
-        Calculates the covariance matrix of asset returns.
+        Calculates the correlation matrix of asset returns.
         Args:
-            return_of_assets: The returns of the assets in the portfolio.
+            return_of_assets: The returns of the assets in the portfolio, one row per
+                asset.
         Returns:
-            np.ndarray: The covariance matrix.
+            np.ndarray: The correlation matrix.
+        """
+        return PortfolioLevelEvaluator._correlation_from_covariance(
+            PortfolioLevelEvaluator._covariance_matrix(return_of_assets)
+        )
+
+    @staticmethod
+    def calculate_covariance_and_correlation_matrices(
+        return_of_assets: list[list[float]] | np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        return np.corrcoef(np.array(return_of_assets))
+        Calculates both the covariance and correlation matrices of asset returns,
+        de-meaning the returns only once.
+        Args:
+            return_of_assets: The returns of the assets in the portfolio, one row per
+                asset.
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The covariance and correlation matrices.
+        """
+        covariance_matrix = PortfolioLevelEvaluator._covariance_matrix(return_of_assets)
+        correlation_matrix = PortfolioLevelEvaluator._correlation_from_covariance(
+            covariance_matrix
+        )
+        return covariance_matrix, correlation_matrix
+
+    @staticmethod
+    def _covariance_matrix(
+        return_of_assets: list[list[float]] | np.ndarray,
+    ) -> np.ndarray:
+        """
+        Computes the sample covariance matrix (ddof=1) of returns laid out one row per
+        asset, as np.cov does.
+        """
+        return_of_assets = np.atleast_2d(
+            np.ascontiguousarray(return_of_assets, dtype=np.float64)
+        )
+        demeaned = return_of_assets - return_of_assets.mean(axis=1, keepdims=True)
+        # NumPy's matmul recognises X @ X.T and hands it to BLAS syrk, which only
+        # computes one triangle of the symmetric product before mirroring it. A
+        # threaded BLAS also splits the product across cores for wide panels.
+        return (demeaned @ demeaned.T) / (return_of_assets.shape[1] - 1)
+
+    @staticmethod
+    def _correlation_from_covariance(covariance_matrix: np.ndarray) -> np.ndarray:
+        """
+        Scales a covariance matrix to a correlation matrix, clipping to [-1, 1] as
+        np.corrcoef does.
+        """
+        std_devs = np.sqrt(np.diag(covariance_matrix))
+        correlation_matrix = covariance_matrix / np.outer(std_devs, std_devs)
+        return np.clip(correlation_matrix, -1.0, 1.0)
 
     @staticmethod
     def calculate_portfolio_risk(
-        weights: list[float], return_of_assets: list[list[float]]
+        weights: list[float] | np.ndarray,
+        return_of_assets: list[list[float]] | np.ndarray,
     ) -> float:
         """
         Calculates the risk (standard deviation) of a portfolio.
+
+        The covariance matrix is recomputed on every call. To evaluate many weight
+        vectors over the same returns, use calculate_portfolio_risks_batch or
+        PortfolioRiskCalculator, which compute it once.
         Args:
             weights: The weights of the assets in the portfolio.
-            return_of_assets: The returns of the assets in the portfolio.
+            return_of_assets: The returns of the assets in the portfolio, one row per
+                asset.
         Returns:
             float: The portfolio risk (standard deviation).
         """
         covariance_matrix = PortfolioLevelEvaluator.calculate_covariance_matrix(
             return_of_assets
         )
-        variance = np.dot(weights, np.dot(covariance_matrix, weights))
-        return np.sqrt(variance)
+        weights = np.asarray(weights, dtype=np.float64)
+        variance = float(weights @ covariance_matrix @ weights)
+        # Rounding can leave a hedged portfolio's variance slightly below zero
+        return sqrt(max(variance, 0.0))
+
+    @staticmethod
+    def calculate_portfolio_risks_batch(
+        weights: list[list[float]] | np.ndarray,
+        return_of_assets: list[list[float]] | np.ndarray,
+    ) -> np.ndarray:
+        """
+        Calculates the risk (standard deviation) of many portfolios over the same
+        assets in a single matrix product.
+        Args:
+            weights: The weights of each portfolio, one row per portfolio.
+            return_of_assets: The returns of the assets in the portfolio, one row per
+                asset.
+        Returns:
+            np.ndarray: The risk of each portfolio.
+        """
+        covariance_matrix = PortfolioLevelEvaluator.calculate_covariance_matrix(
+            return_of_assets
+        )
+        weights = np.atleast_2d(np.asarray(weights, dtype=np.float64))
+        variances = np.einsum("ki,ki->k", weights @ covariance_matrix, weights)
+        return np.sqrt(np.maximum(variances, 0.0))
+
+
+class PortfolioRiskCalculator:
+    """
+    Evaluates the risk of many portfolios drawn from the same set of assets, such as
+    when tracing out an efficient frontier.
+
+    The covariance matrix is computed and factorised once as covariance = L @ L.T,
+    after which the risk of any weight vector is the norm of L.T @ weights.
+    """
+
+    def __init__(self, return_of_assets: list[list[float]] | np.ndarray):
+        """
+        Args:
+            return_of_assets: The returns of the assets in the portfolio, one row per
+                asset.
+        """
+        self.covariance_matrix = PortfolioLevelEvaluator.calculate_covariance_matrix(
+            return_of_assets
+        )
+        self._factor = self._factorise(self.covariance_matrix)
+
+    @staticmethod
+    def _factorise(covariance_matrix: np.ndarray) -> np.ndarray:
+        """
+        Factorises a covariance matrix as L @ L.T. Uses the Cholesky decomposition,
+        falling back to a symmetric eigendecomposition when the matrix is only
+        positive semi-definite (e.g. fewer observations than assets).
+        """
+        covariance_matrix = np.atleast_2d(covariance_matrix)
+        try:
+            return np.linalg.cholesky(covariance_matrix)
+        except np.linalg.LinAlgError:
+            eigenvalues, eigenvectors = np.linalg.eigh(covariance_matrix)
+            return eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+
+    def risk(self, weights: list[float] | np.ndarray) -> float:
+        """
+        Calculates the risk (standard deviation) of a portfolio.
+        Args:
+            weights: The weights of the assets in the portfolio.
+        Returns:
+            float: The portfolio risk (standard deviation).
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        return float(np.linalg.norm(self._factor.T @ weights))
@@ -1,6 +1,6 @@
-from math import prod, sqrt
+from math import sqrt
 
-from statsmodels.stats.weightstats import DescrStatsW
+import numpy as np
 
 
 class RiskReturnEvaluator:
@@ -48,15 +48,7 @@ class RiskReturnEvaluator:
             >>> geometric_mean_return(returns)
             0.0128  # Geometric mean return of ~1.28%
         """
-        if not returns:
-            raise ValueError("The list of returns cannot be empty.")
-
-        growth_factors = [1 + r for r in returns]
-        product_of_growth_factors = prod(growth_factors)
-        n = len(
-            returns
-        )  # Number of periods is determined by the length of the returns list
-        return product_of_growth_factors ** (1 / n) - 1
+        return float(np.expm1(RiskReturnEvaluator._mean_log_growth(returns)))
 
     @staticmethod
     def annualized_geometric_mean_return(
@@ -78,8 +70,26 @@ class RiskReturnEvaluator:
             >>> annualized_geometric_mean_return(returns, periods_per_year=12)
             0.1268  # Annualized geometric mean return of ~12.68%
         """
-        geometric_mean = RiskReturnEvaluator.geometric_mean_return(returns)
-        return (1 + geometric_mean) ** periods_per_year - 1
+        mean_log_growth = RiskReturnEvaluator._mean_log_growth(returns)
+        return float(np.expm1(mean_log_growth * periods_per_year))
+
+    @staticmethod
+    def _mean_log_growth(returns: list[float]) -> float:
+        """
+        Calculates the mean log growth factor of a series of returns. Working in log
+        space avoids the overflow/underflow of multiplying long series of growth
+        factors together.
+
+        Args:
+            returns: A list of percentage returns.
+
+        Returns:
+            float: The mean of log(1 + r) over the returns.
+        """
+        returns = np.asarray(returns, dtype=np.float64)
+        if returns.size == 0:
+            raise ValueError("The list of returns cannot be empty.")
+        return np.log1p(returns).mean()
 
     @staticmethod
     def arithmetic_mean_return(
@@ -104,15 +114,13 @@ class RiskReturnEvaluator:
             >>> arithmetic_mean_return(returns, probabilities)
             0.061  # Weighted mean return of 6.1%
         """
+        returns = np.asarray(returns, dtype=np.float64)
         if probabilities is None:
-            # Assume equally weighted probabilities
-            probabilities = [1 / len(returns) for _ in range(len(returns))]
+            # Equally weighted probabilities reduce to the plain mean
+            return float(returns.mean())
 
-        weighted_returns = [
-            probabilities[i] * returns[i] for i in range(len(probabilities))
-        ]
-        weighted_mean_return = sum(weighted_returns)
-        return weighted_mean_return
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        return float(np.dot(probabilities, returns))
 
     @staticmethod
     def volatility(
@@ -139,7 +147,14 @@ class RiskReturnEvaluator:
             >>> volatility(returns, probabilities, time_period=30)  # 30-day volatility
             0.123  # Example output
         """
-        desc_stats = DescrStatsW(returns, weights=probabilities)
-        std_dev = desc_stats.std  # Standard deviation of returns
+        returns = np.asarray(returns, dtype=np.float64)
+        if probabilities is None:
+            weights = np.full(returns.size, 1 / returns.size)
+        else:
+            weights = np.asarray(probabilities, dtype=np.float64)
+        total_weight = weights.sum()
+        mean_return = (weights @ returns) / total_weight
+        variance = (weights @ (returns - mean_return) ** 2) / total_weight
+        std_dev = sqrt(variance)  # Standard deviation of returns
         scaled_volatility = std_dev * sqrt(time_period)  # Scale by square root of time
         return scaled_volatility
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from investalchemy.equity_evaluator import EquityEvaluator
+
+# Create an instance of the class
+evaluator = EquityEvaluator()
+
+
+@pytest.mark.parametrize(
+    "cash_flows, expected",
+    [
+        ([-100, 50, 60, 70], 62.51),  # Investment followed by inflows
+        (np.array([-100.0, 50.0, 60.0, 70.0]), 62.51),  # NumPy input
+        ([], 0.0),  # No cash flows
+    ],
+)
+def test_net_present_value(cash_flows, expected):
+    """
+    Test the net_present_value method with various inputs.
+    """
+    result = evaluator.net_present_value(cash_flows, 0.05)
+    assert round(result, 2) == expected
+
+
+@pytest.mark.parametrize("n", [4, 32, 33, 360])
+def test_net_present_value_matches_discounted_sum(n):
+    """
+    Test the net_present_value method on both sides of the Horner cut-over.
+    """
+    cash_flows = [-100.0] + [10.0] * (n - 1)
+    expected_ans = sum(cf / 1.05**t for t, cf in enumerate(cash_flows))
+    result = evaluator.net_present_value(cash_flows, 0.05)
+    assert np.isclose(result, expected_ans)
+
+
+@pytest.mark.parametrize(
+    "dividend_payment, r, t, expected",
+    [
+        (5, 0.05, 10, 38.61),  # Docstring example
+        (5, 0.0, 10, 50.0),  # Zero rate: undiscounted sum of dividends
+        (5, 0.05, 0, 0.0),  # No dividends
+    ],
+)
+def test_stock_valuation_dividend_discount_model(dividend_payment, r, t, expected):
+    """
+    Test the stock_valuation_dividend_discount_model method against the explicit
+    discounted sum of dividends.
+    """
+    result = evaluator.stock_valuation_dividend_discount_model(dividend_payment, r, t)
+    discounted_sum = sum(dividend_payment / (1 + r) ** i for i in range(1, t + 1))
+    assert round(result, 2) == expected
+    assert np.isclose(result, discounted_sum)
@@ -0,0 +1,80 @@
+import numpy as np
+from pytest import fixture, importorskip
+
+from investalchemy.fi_evaluator import FixedIncomeEvaluator
+
+
+@fixture(scope="function")
+def fi_evaluator():
+    return FixedIncomeEvaluator()
+
+
+def test_bond_price_at_par(fi_evaluator):
+    result = fi_evaluator.bond_price(50, 1000, 0.05, 10)
+
+    assert round(result, 2) == 1000.0
+
+
+def test_bond_price_batch_matches_scalar(fi_evaluator):
+    rates = np.array([0.03, 0.05, 0.07])
+    periods = np.array([5, 10, 20])
+
+    result = fi_evaluator.bond_price_batch(50, 1000, rates, periods)
+
+    expected = [
+        fi_evaluator.bond_price(50, 1000, r, n)
+        for r, n in zip(rates, periods, strict=True)
+    ]
+    np.testing.assert_allclose(result, expected)
+
+
+def test_treasury_bill_price_batch_matches_scalar(fi_evaluator):
+    days = np.array([30, 90, 180])
+
+    result = fi_evaluator.treasury_bill_price_batch(1000, 0.02, days)
+
+    expected = [fi_evaluator.treasury_bill_price(1000, 0.02, D) for D in days]
+    np.testing.assert_allclose(result, expected)
+
+
+def test_bond_price_grid_shape_and_values(fi_evaluator):
+    rates = [0.03, 0.05, 0.07]
+    periods = [5, 10]
+
+    result = fi_evaluator.bond_price_grid(50, 1000, rates, periods)
+
+    assert result.shape == (3, 2)
+    assert round(result[1, 1], 2) == 1000.0
+    expected = fi_evaluator.bond_price(50, 1000, 0.07, 5)
+    assert round(result[2, 0], 6) == round(expected, 6)
+
+
+def test_treasury_curve_batch_round_trip(fi_evaluator):
+    days = np.array([30, 90, 180, 360])
+    prices = fi_evaluator.treasury_bill_price_batch(1000, 0.02, days)
+
+    yields = fi_evaluator.yield_for_treasury_bill_batch(1000, prices)
+    aprs = fi_evaluator.apr_for_treasury_bills_batch(yields, days)
+
+    expected = [
+        fi_evaluator.apr_for_treasury_bills(
+            fi_evaluator.yield_for_treasury_bill(1000, price), D
+        )
+        for price, D in zip(prices, days, strict=True)
+    ]
+    np.testing.assert_allclose(aprs, expected)
+
+
+def test_native_batch_kernels_match_jit_kernels():
+    fi_native = importorskip("investalchemy._fi_native")
+    from investalchemy import _fi_kernels
+
+    rates = np.array([0.03, 0.05, 0.07])
+    periods = np.array([5.0, 10.0, 20.0])
+    coupons = np.full(3, 50.0)
+    principals = np.full(3, 1000.0)
+
+    np.testing.assert_allclose(
+        fi_native.bond_price_batch(coupons, principals, rates, periods),
+        _fi_kernels.bond_price_batch(coupons, principals, rates, periods),
+    )
@@ -1,6 +1,10 @@
+import numpy as np
 from pytest import fixture
 
-from investalchemy.portfolio_risk_return import PortfolioLevelEvaluator
+from investalchemy.portfolio_risk_return import (
+    PortfolioLevelEvaluator,
+    PortfolioRiskCalculator,
+)
 
 
 @fixture(scope="function")
@@ -42,3 +46,98 @@ def test_calculate_portfolio_risk(portfolio_evaluator):
     result = portfolio_evaluator.calculate_portfolio_risk(weights, return_of_assets)
 
     assert round(result * 100, 2) == 2.78
+
+
+def test_calculate_portfolio_risk_with_ndarray_inputs(portfolio_evaluator):
+    weights = np.array([0.5, 0.3, 0.2])
+    return_of_assets = np.array(
+        [[0.05, -0.02, 0.03], [0.10, 0.06, 0.08], [0.08, 0.04, 0.06]]
+    )
+
+    result = portfolio_evaluator.calculate_portfolio_risk(weights, return_of_assets)
+
+    assert round(result * 100, 2) == 2.78
+
+
+def test_calculate_portfolio_risk_sees_in_place_updates(portfolio_evaluator):
+    weights = [0.5, 0.3, 0.2]
+    return_of_assets = np.array(
+        [[0.05, -0.02, 0.03], [0.10, 0.06, 0.08], [0.08, 0.04, 0.06]]
+    )
+    before = portfolio_evaluator.calculate_portfolio_risk(weights, return_of_assets)
+
+    return_of_assets *= 2
+
+    after = portfolio_evaluator.calculate_portfolio_risk(weights, return_of_assets)
+    assert np.isclose(after, 2 * before)
+
+
+def test_portfolio_risk_calculator_matches_portfolio_risk(portfolio_evaluator):
+    rng = np.random.default_rng(0)
+    return_of_assets = rng.normal(0.05, 0.1, size=(4, 60))
+    calculator = PortfolioRiskCalculator(return_of_assets)
+
+    for weights in rng.dirichlet(np.ones(4), size=5):
+        expected = portfolio_evaluator.calculate_portfolio_risk(
+            weights, return_of_assets
+        )
+        assert np.isclose(calculator.risk(weights), expected)
+
+
+def test_portfolio_risk_calculator_with_singular_covariance():
+    weights = [0.5, 0.3, 0.2]
+    return_of_assets = [[0.05, -0.02, 0.03], [0.10, 0.06, 0.08], [0.08, 0.04, 0.06]]
+
+    result = PortfolioRiskCalculator(return_of_assets).risk(weights)
+
+    assert round(result * 100, 2) == 2.78
+
+
+def test_calculate_portfolio_risks_batch(portfolio_evaluator):
+    weights = [[0.5, 0.3, 0.2], [0.2, 0.3, 0.5], [1.0, 0.0, 0.0]]
+    return_of_assets = [[0.05, -0.02, 0.03], [0.10, 0.06, 0.08], [0.08, 0.04, 0.06]]
+
+    result = portfolio_evaluator.calculate_portfolio_risks_batch(
+        weights, return_of_assets
+    )
+
+    expected = [
+        portfolio_evaluator.calculate_portfolio_risk(w, return_of_assets)
+        for w in weights
+    ]
+    np.testing.assert_allclose(result, expected)
+
+
+def test_covariance_and_correlation_matrices_match_numpy(portfolio_evaluator):
+    rng = np.random.default_rng(1)
+    returns = rng.normal(0.05, 0.1, size=(5, 40))
+
+    covariance, correlation = (
+        portfolio_evaluator.calculate_covariance_and_correlation_matrices(returns)
+    )
+
+    np.testing.assert_allclose(covariance, np.cov(returns))
+    np.testing.assert_allclose(correlation, np.corrcoef(returns))
+
+
+def test_portfolio_risk_of_perfectly_hedged_portfolios(portfolio_evaluator):
+    rng = np.random.default_rng(2)
+    a = rng.normal(0.05, 0.1, size=250)
+    return_of_assets = np.array([a, 2 * a + 0.3, 0.7 * a - 0.1])
+    # Each row has zero exposure to a: w0 + 2 * w1 + 0.7 * w2 == 0
+    w1, w2 = rng.normal(size=(2, 200))
+    weights = np.column_stack([-2 * w1 - 0.7 * w2, w1, w2])
+    calculator = PortfolioRiskCalculator(return_of_assets)
+
+    risks = [
+        portfolio_evaluator.calculate_portfolio_risk(w, return_of_assets)
+        for w in weights
+    ]
+    batch_risks = portfolio_evaluator.calculate_portfolio_risks_batch(
+        weights, return_of_assets
+    )
+    calculator_risks = [calculator.risk(w) for w in weights]
+
+    np.testing.assert_allclose(risks, 0.0, atol=1e-6)
+    np.testing.assert_allclose(batch_risks, 0.0, atol=1e-6)
+    np.testing.assert_allclose(calculator_risks, 0.0, atol=1e-6)
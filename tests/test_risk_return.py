@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 from investalchemy.risk_return import RiskReturnEvaluator
@@ -40,7 +43,7 @@ def test_arithmetic_mean_return_with_given_probabilities():
     returns = [0.10, 0.05, 0.30]
     expected_ans = 0.14
     result = evaluator.arithmetic_mean_return(returns, probabilities)
-    assert result == expected_ans
+    assert round(result, 4) == expected_ans
 
 
 def test_volatility_with_given_probabilities():
@@ -52,3 +55,47 @@ def test_volatility_with_given_probabilities():
     expected_ans = 0.1068
     result = evaluator.volatility(returns, probabilities)
     assert round(result, 4) == expected_ans
+
+
+def test_annualized_geometric_mean_return():
+    """
+    Test the annualized_geometric_mean_return method compounds the per-period mean.
+    """
+    returns = [0.01, 0.02, -0.01, 0.03, -0.02]
+    geometric_mean = evaluator.geometric_mean_return(returns)
+    expected_ans = round((1 + geometric_mean) ** 12 - 1, 10)
+    result = evaluator.annualized_geometric_mean_return(returns, periods_per_year=12)
+    assert round(result, 10) == expected_ans
+
+
+def test_geometric_mean_return_with_empty_returns():
+    """
+    Test the geometric_mean_return method rejects an empty list of returns.
+    """
+    with pytest.raises(ValueError):
+        evaluator.geometric_mean_return([])
+
+
+def test_volatility_with_equal_probabilities_scaled_by_time():
+    """
+    Test the volatility method with equal probabilities over a 30-day horizon.
+    """
+    returns = [0.01, 0.02, -0.01, 0.03, -0.02]
+    expected_ans = 0.1016
+    result = evaluator.volatility(returns, time_period=30)
+    assert round(result, 4) == expected_ans
+
+
+def test_import_does_not_load_heavy_dependencies():
+    """
+    Test that importing the evaluators does not pull in statsmodels, pandas or numba.
+    """
+    code = (
+        "import sys\n"
+        "import investalchemy.risk_return, investalchemy.fi_evaluator\n"
+        "print(sorted({'statsmodels', 'pandas', 'numba'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"